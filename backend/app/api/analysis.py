@@ -5,30 +5,153 @@ Core endpoints for AI system compliance assessment against EU AI Act.
 """
 
 from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
-from typing import List, Optional
+from fastapi.responses import ORJSONResponse, Response
+from functools import lru_cache
+from typing import List, Optional, Tuple, Type
+from pydantic import BaseModel, TypeAdapter
+import logging
 import time
 import uuid
-from datetime import datetime
 
 from app.models.compliance import (
     AISystemDescription,
     ComplianceAnalysisRequest,
     ComplianceAnalysisResponse,
-    ComplianceReport,
-    RiskCategory
+    RiskCategory,
+    RiskCategoryInfo,
+    AIApplicationDomain,
+    ApplicationDomainInfo
 )
 from app.services.compliance_analyzer import ComplianceAnalyzerService
-from app.core.config import settings
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+logger = logging.getLogger(__name__)
 
-# Dependency to get compliance analyzer service
-def get_compliance_analyzer():
-    """Dependency to provide compliance analyzer service."""
+# Static reference data served by the lookup endpoints, built once at import
+_RISK_CATEGORIES = [
+    {
+        "category": RiskCategory.UNACCEPTABLE,
+        "title": "Unacceptable Risk",
+        "description": "AI practices that are prohibited under the EU AI Act",
+        "examples": [
+            "Social scoring systems",
+            "Real-time biometric identification in public spaces",
+            "Emotion recognition in workplace/education",
+            "Subliminal manipulation techniques"
+        ]
+    },
+    {
+        "category": RiskCategory.HIGH,
+        "title": "High Risk", 
+        "description": "AI systems subject to strict compliance requirements",
+        "examples": [
+            "Safety components in critical infrastructure",
+            "Educational assessment systems",
+            "Employment decision systems",
+            "Essential service access systems",
+            "Law enforcement applications"
+        ]
+    },
+    {
+        "category": RiskCategory.LIMITED,
+        "title": "Limited Risk",
+        "description": "AI systems with transparency obligations",
+        "examples": [
+            "Chatbots and conversational AI",
+            "Emotion recognition systems",
+            "Biometric categorization",
+            "AI-generated content"
+        ]
+    },
+    {
+        "category": RiskCategory.MINIMAL,
+        "title": "Minimal Risk",
+        "description": "AI systems with no specific obligations under EU AI Act",
+        "examples": [
+            "AI-enabled video games",
+            "Spam filters",
+            "Inventory management systems",
+            "Most other AI applications"
+        ]
+    }
+]
+
+_DOMAIN_DESCRIPTIONS = {
+    AIApplicationDomain.BIOMETRIC_IDENTIFICATION: "Biometric identification and verification systems",
+    AIApplicationDomain.CRITICAL_INFRASTRUCTURE: "Critical infrastructure safety and security",
+    AIApplicationDomain.EDUCATION: "Educational and vocational training systems",
+    AIApplicationDomain.EMPLOYMENT: "Employment, worker management, and recruitment",
+    AIApplicationDomain.ESSENTIAL_SERVICES: "Essential private and public services access",
+    AIApplicationDomain.LAW_ENFORCEMENT: "Law enforcement applications",
+    AIApplicationDomain.MIGRATION_ASYLUM: "Migration, asylum and border control",
+    AIApplicationDomain.JUSTICE_DEMOCRACY: "Administration of justice and democratic processes",
+    AIApplicationDomain.HEALTHCARE: "Healthcare and medical applications",
+    AIApplicationDomain.FINANCE: "Financial services and credit assessment",
+    AIApplicationDomain.TRANSPORT: "Transportation and autonomous vehicles",
+    AIApplicationDomain.ENERGY: "Energy grid and utilities management",
+    AIApplicationDomain.SOCIAL_MEDIA: "Social media and content platforms",
+    AIApplicationDomain.GAMING: "Gaming and entertainment",
+    AIApplicationDomain.GENERAL_PURPOSE: "General purpose AI systems",
+    AIApplicationDomain.OTHER: "Other applications not listed above"
+}
+
+_DOMAINS = [
+    {"domain": domain.value, "description": description}
+    for domain, description in _DOMAIN_DESCRIPTIONS.items()
+]
+
+
+def _encode_static_payload(model: Type[BaseModel], payload: List[dict]) -> bytes:
+    """Validate a static payload against its response model and encode it once."""
+    adapter = TypeAdapter(List[model])
+    return adapter.dump_json(adapter.validate_python(payload))
+
+
+# Returning a Response skips response_model validation, so the payloads are
+# checked against their documented schemas here instead
+_RISK_CATEGORIES_JSON = _encode_static_payload(RiskCategoryInfo, _RISK_CATEGORIES)
+_DOMAINS_JSON = _encode_static_payload(ApplicationDomainInfo, _DOMAINS)
+
+
+# Failed analyzer builds are remembered for this long before retrying
+ANALYZER_FAILURE_TTL_SECONDS = 30.0
+
+# (expiry, error detail) of the last failed analyzer build
+_analyzer_failure: Optional[Tuple[float, str]] = None
+
+
+@lru_cache(maxsize=1)
+def _build_compliance_analyzer() -> ComplianceAnalyzerService:
+    """Construct the shared compliance analyzer service."""
     return ComplianceAnalyzerService()
 
 
-@router.post("/assess", response_model=ComplianceAnalysisResponse)
+# Dependency to get compliance analyzer service
+def get_compliance_analyzer() -> ComplianceAnalyzerService:
+    """
+    Dependency to provide the shared compliance analyzer service.
+    
+    If construction fails (e.g. missing credentials), the failure is cached
+    for ANALYZER_FAILURE_TTL_SECONDS so requests fail fast with 503 instead
+    of repeating the expensive failing setup on every call.
+    """
+    global _analyzer_failure
+    
+    if _analyzer_failure is not None:
+        expiry, detail = _analyzer_failure
+        if time.monotonic() < expiry:
+            raise HTTPException(status_code=503, detail=detail)
+        _analyzer_failure = None
+    
+    try:
+        return _build_compliance_analyzer()
+    except Exception as e:
+        detail = f"Compliance analyzer unavailable: {str(e)}"
+        _analyzer_failure = (time.monotonic() + ANALYZER_FAILURE_TTL_SECONDS, detail)
+        raise HTTPException(status_code=503, detail=detail)
+
+
+@router.post("/assess", responses={200: {"model": ComplianceAnalysisResponse}})
 async def analyze_ai_system(
     request: ComplianceAnalysisRequest,
     background_tasks: BackgroundTasks,
@@ -41,23 +164,10 @@ async def analyze_ai_system(
     with risk categorization and recommendations.
     """
     start_time = time.time()
-    analysis_id = str(uuid.uuid4())
+    analysis_id = uuid.uuid4().hex
     
     try:
-        # Validate input
-        if len(request.ai_system.description) < 10:
-            raise HTTPException(
-                status_code=400,
-                detail="AI system description must be at least 10 characters"
-            )
-        
-        if len(request.ai_system.description) > settings.MAX_ANALYSIS_LENGTH:
-            raise HTTPException(
-                status_code=400,
-                detail=f"AI system description exceeds maximum length of {settings.MAX_ANALYSIS_LENGTH}"
-            )
-        
-        # Perform analysis
+        # Perform analysis (description length is enforced by AISystemDescription)
         report = await analyzer.analyze_system(request.ai_system)
         
         processing_time = time.time() - start_time
@@ -72,12 +182,13 @@ async def analyze_ai_system(
             user_id=request.user_id
         )
         
-        return ComplianceAnalysisResponse(
+        response = ComplianceAnalysisResponse(
             success=True,
             report=report,
             analysis_id=analysis_id,
             processing_time_seconds=processing_time
         )
+        return Response(response.model_dump_json(), media_type="application/json")
     
     except HTTPException:
         raise
@@ -92,98 +203,29 @@ async def analyze_ai_system(
             processing_time=processing_time
         )
         
-        return ComplianceAnalysisResponse(
+        response = ComplianceAnalysisResponse(
             success=False,
             error_message=f"Analysis failed: {str(e)}",
             analysis_id=analysis_id,
             processing_time_seconds=processing_time
         )
+        return Response(response.model_dump_json(), media_type="application/json")
 
 
-@router.get("/risk-categories", response_model=List[dict])
+@router.get("/risk-categories", response_model=List[RiskCategoryInfo])
 async def get_risk_categories():
     """Get list of EU AI Act risk categories with descriptions."""
-    return [
-        {
-            "category": RiskCategory.UNACCEPTABLE,
-            "title": "Unacceptable Risk",
-            "description": "AI practices that are prohibited under the EU AI Act",
-            "examples": [
-                "Social scoring systems",
-                "Real-time biometric identification in public spaces",
-                "Emotion recognition in workplace/education",
-                "Subliminal manipulation techniques"
-            ]
-        },
-        {
-            "category": RiskCategory.HIGH,
-            "title": "High Risk", 
-            "description": "AI systems subject to strict compliance requirements",
-            "examples": [
-                "Safety components in critical infrastructure",
-                "Educational assessment systems",
-                "Employment decision systems",
-                "Essential service access systems",
-                "Law enforcement applications"
-            ]
-        },
-        {
-            "category": RiskCategory.LIMITED,
-            "title": "Limited Risk",
-            "description": "AI systems with transparency obligations",
-            "examples": [
-                "Chatbots and conversational AI",
-                "Emotion recognition systems",
-                "Biometric categorization",
-                "AI-generated content"
-            ]
-        },
-        {
-            "category": RiskCategory.MINIMAL,
-            "title": "Minimal Risk",
-            "description": "AI systems with no specific obligations under EU AI Act",
-            "examples": [
-                "AI-enabled video games",
-                "Spam filters",
-                "Inventory management systems",
-                "Most other AI applications"
-            ]
-        }
-    ]
+    return Response(_RISK_CATEGORIES_JSON, media_type="application/json")
 
 
-@router.get("/domains", response_model=List[dict])
+@router.get("/domains", response_model=List[ApplicationDomainInfo])
 async def get_application_domains():
     """Get list of AI application domains for classification."""
-    from app.models.compliance import AIApplicationDomain
-    
-    domain_descriptions = {
-        AIApplicationDomain.BIOMETRIC_IDENTIFICATION: "Biometric identification and verification systems",
-        AIApplicationDomain.CRITICAL_INFRASTRUCTURE: "Critical infrastructure safety and security",
-        AIApplicationDomain.EDUCATION: "Educational and vocational training systems",
-        AIApplicationDomain.EMPLOYMENT: "Employment, worker management, and recruitment",
-        AIApplicationDomain.ESSENTIAL_SERVICES: "Essential private and public services access",
-        AIApplicationDomain.LAW_ENFORCEMENT: "Law enforcement applications",
-        AIApplicationDomain.MIGRATION_ASYLUM: "Migration, asylum and border control",
-        AIApplicationDomain.JUSTICE_DEMOCRACY: "Administration of justice and democratic processes",
-        AIApplicationDomain.HEALTHCARE: "Healthcare and medical applications",
-        AIApplicationDomain.FINANCE: "Financial services and credit assessment",
-        AIApplicationDomain.TRANSPORT: "Transportation and autonomous vehicles",
-        AIApplicationDomain.ENERGY: "Energy grid and utilities management",
-        AIApplicationDomain.SOCIAL_MEDIA: "Social media and content platforms",
-        AIApplicationDomain.GAMING: "Gaming and entertainment",
-        AIApplicationDomain.GENERAL_PURPOSE: "General purpose AI systems",
-        AIApplicationDomain.OTHER: "Other applications not listed above"
-    }
-    
-    return [
-        {"domain": domain.value, "description": description}
-        for domain, description in domain_descriptions.items()
-    ]
+    return Response(_DOMAINS_JSON, media_type="application/json")
 
 
 @router.get("/report/{analysis_id}")
-async def get_analysis_report(analysis_id: str):
+def get_analysis_report(analysis_id: str):
     """
     Retrieve analysis report by ID.
     
@@ -198,7 +240,7 @@ async def get_analysis_report(analysis_id: str):
 
 
 @router.post("/validate")
-async def validate_system_description(system: AISystemDescription):
+def validate_system_description(system: AISystemDescription):
     """
     Validate AI system description without performing full analysis.
     
@@ -230,15 +272,15 @@ async def validate_system_description(system: AISystemDescription):
                 "Large user base detected. Consider additional privacy and safety measures."
             )
         
-        return validation_results
+        return ORJSONResponse(validation_results)
     
     except Exception as e:
-        return {
+        return ORJSONResponse({
             "valid": False,
             "error": str(e),
             "warnings": [],
             "suggestions": []
-        }
+        })
 
 
 async def _log_analysis(
@@ -250,8 +292,10 @@ async def _log_analysis(
 ):
     """Log successful analysis for monitoring and analytics."""
     # TODO: Implement actual logging to database or monitoring service
-    print(f"Analysis completed: {analysis_id}, system: {system_id}, "
-          f"time: {processing_time:.2f}s, risk: {risk_category}, user: {user_id}")
+    logger.info(
+        "Analysis completed: %s, system: %s, time: %.2fs, risk: %s, user: %s",
+        analysis_id, system_id, processing_time, risk_category.value, user_id
+    )
 
 
 async def _log_analysis_error(
@@ -261,4 +305,7 @@ async def _log_analysis_error(
 ):
     """Log analysis error for debugging."""
     # TODO: Implement actual error logging
-    print(f"Analysis failed: {analysis_id}, error: {error}, time: {processing_time:.2f}s")
\ No newline at end of file
+    logger.error(
+        "Analysis failed: %s, error: %s, time: %.2fs",
+        analysis_id, error, processing_time
+    )
\ No newline at end of file
@@ -5,13 +5,31 @@ Basic health monitoring and service status endpoints.
 """
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from typing import Dict, Any
-from datetime import datetime
-import os
+from typing import Dict, Any, Tuple
+from datetime import datetime, timezone
+import asyncio
 import psutil
+import time
 
-router = APIRouter()
+from app.core.cache import async_ttl_cache, ttl_cache
+from app.core.config import settings
+
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Probes can hit these endpoints many times per second; dependency checks
+# are reused for this long before being re-run.
+DEPENDENCY_CHECK_TTL_SECONDS = 5.0
+MEMORY_SAMPLE_TTL_SECONDS = 1.0
+
+_PROCESS = psutil.Process()
+_PROCESS_CREATE_TIME = _PROCESS.create_time()
+
+# Settings don't change after startup; bind the values the checks read
+_DATABASE_URL = settings.database_url
+_ANTHROPIC_API_KEY = settings.ANTHROPIC_API_KEY
+_OPENAI_API_KEY = settings.OPENAI_API_KEY
 
 
 class HealthResponse(BaseModel):
@@ -34,36 +52,27 @@ class ServiceStatus(BaseModel):
 async def health_check():
     """Basic health check endpoint."""
     try:
-        # Get system metrics
-        process = psutil.Process()
-        uptime = process.create_time()
-        current_time = datetime.utcnow()
+        db_status, ai_status = await asyncio.gather(_check_database(), _check_ai_services())
         
         checks = {
             "api": {"status": "healthy", "details": "API is responding"},
-            "database": await _check_database(),
-            "ai_service": await _check_ai_services(),
+            "database": db_status,
+            "ai_service": ai_status,
             "memory_usage": {
                 "status": "healthy",
-                "details": {
-                    "memory_percent": process.memory_percent(),
-                    "memory_mb": process.memory_info().rss / 1024 / 1024
-                }
+                "details": _sample_memory()
             }
         }
         
         # Determine overall status
-        overall_status = "healthy"
-        for check_name, check_result in checks.items():
-            if check_result.get("status") != "healthy":
-                overall_status = "degraded"
-                break
+        degraded = any(check.get("status") != "healthy" for check in checks.values())
+        overall_status = "degraded" if degraded else "healthy"
         
         return HealthResponse(
             status=overall_status,
-            timestamp=current_time,
+            timestamp=datetime.now(timezone.utc),
             version="0.1.0",
-            uptime_seconds=(current_time.timestamp() - uptime),
+            uptime_seconds=(time.time() - _PROCESS_CREATE_TIME),
             checks=checks
         )
     
@@ -78,9 +87,9 @@ async def health_check():
 async def detailed_health():
     """Detailed health check with individual service status."""
     services = {}
+    db_status, ai_status = await asyncio.gather(_check_database(), _check_ai_services())
     
     # Database check
-    db_status = await _check_database()
     services["database"] = ServiceStatus(
         name="Database",
         status=db_status["status"],
@@ -88,7 +97,6 @@ async def detailed_health():
     )
     
     # AI Services check
-    ai_status = await _check_ai_services()
     services["ai_services"] = ServiceStatus(
         name="AI Services",
         status=ai_status["status"],
@@ -110,13 +118,12 @@ async def readiness_check():
     """Kubernetes-style readiness check."""
     try:
         # Check critical dependencies
-        db_status = await _check_database()
-        ai_status = await _check_ai_services()
+        db_status, ai_status = await asyncio.gather(_check_database(), _check_ai_services())
         
         if db_status["status"] != "healthy" or ai_status["status"] != "healthy":
             raise HTTPException(status_code=503, detail="Service not ready")
         
-        return {"status": "ready", "timestamp": datetime.utcnow()}
+        return {"status": "ready", "timestamp": datetime.now(timezone.utc)}
     
     except HTTPException:
         raise
@@ -127,16 +134,28 @@ async def readiness_check():
 @router.get("/live")
 async def liveness_check():
     """Kubernetes-style liveness check."""
-    return {"status": "alive", "timestamp": datetime.utcnow()}
+    return {"status": "alive", "timestamp": datetime.now(timezone.utc)}
 
 
+@ttl_cache(MEMORY_SAMPLE_TTL_SECONDS)
+def _read_memory() -> Tuple[float, float]:
+    """Read memory usage of the API process as (percent, megabytes)."""
+    return _PROCESS.memory_percent(), _PROCESS.memory_info().rss / 1024 / 1024
+
+
+def _sample_memory() -> Dict[str, Any]:
+    """Sample memory usage of the API process."""
+    memory_percent, memory_mb = _read_memory()
+    return {"memory_percent": memory_percent, "memory_mb": memory_mb}
+
+
+@async_ttl_cache(DEPENDENCY_CHECK_TTL_SECONDS)
 async def _check_database() -> Dict[str, Any]:
     """Check database connectivity."""
     try:
         # TODO: Implement actual database connection check
         # For now, check if database URL is configured
-        from app.core.config import settings
-        db_url = settings.get_database_url()
+        db_url = _DATABASE_URL
         
         if not db_url:
             return {
@@ -160,23 +179,22 @@ async def _check_database() -> Dict[str, Any]:
         }
 
 
+@async_ttl_cache(DEPENDENCY_CHECK_TTL_SECONDS)
 async def _check_ai_services() -> Dict[str, Any]:
     """Check AI service connectivity."""
     try:
-        from app.core.config import settings
-        
         services = {}
         overall_status = "healthy"
         
         # Check Anthropic API key
-        if settings.ANTHROPIC_API_KEY:
+        if _ANTHROPIC_API_KEY:
             services["anthropic"] = "configured"
         else:
             services["anthropic"] = "not_configured"
             overall_status = "degraded"
         
         # Check OpenAI API key (optional)
-        if settings.OPENAI_API_KEY:
+        if _OPENAI_API_KEY:
             services["openai"] = "configured"
         else:
             services["openai"] = "not_configured"
@@ -0,0 +1,63 @@
+"""
+In-process caching helpers for EU AI Act Compliance Bot.
+
+Short-lived TTL caches for checks and metrics that are polled far more
+often than their results change (health and readiness probes).
+"""
+
+import copy
+import functools
+import time
+from typing import Any, Awaitable, Callable, Dict, TypeVar
+
+T = TypeVar("T")
+
+
+def async_ttl_cache(ttl: float) -> Callable[[Callable[[], Awaitable[T]]], Callable[[], Awaitable[T]]]:
+    """
+    Cache the result of a zero-argument coroutine function for ``ttl`` seconds.
+
+    Each caller gets a deep copy of the cached result, so mutating it cannot
+    change what later callers see. Concurrent callers that miss the cache may
+    each await the wrapped coroutine, so it must be cheap and side-effect free.
+    """
+    def decorator(func: Callable[[], Awaitable[T]]) -> Callable[[], Awaitable[T]]:
+        state: Dict[str, Any] = {"expiry": 0.0, "value": None}
+
+        @functools.wraps(func)
+        async def wrapper() -> T:
+            if time.monotonic() >= state["expiry"]:
+                state["value"] = await func()
+                state["expiry"] = time.monotonic() + ttl
+            return copy.deepcopy(state["value"])
+
+        def cache_clear() -> None:
+            state["expiry"] = 0.0
+            state["value"] = None
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
+
+
+def ttl_cache(ttl: float) -> Callable[[Callable[[], T]], Callable[[], T]]:
+    """Cache the result of a zero-argument function for ``ttl`` seconds."""
+    def decorator(func: Callable[[], T]) -> Callable[[], T]:
+        state: Dict[str, Any] = {"expiry": 0.0, "value": None}
+
+        @functools.wraps(func)
+        def wrapper() -> T:
+            if time.monotonic() >= state["expiry"]:
+                state["value"] = func()
+                state["expiry"] = time.monotonic() + ttl
+            return state["value"]
+
+        def cache_clear() -> None:
+            state["expiry"] = 0.0
+            state["value"] = None
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
@@ -5,8 +5,10 @@ Environment-based configuration using Pydantic settings.
 """
 
 from pydantic_settings import BaseSettings
+from functools import cached_property
 from typing import List, Optional
-import os
+
+from app.models.compliance import MAX_DESCRIPTION_LENGTH
 
 
 class Settings(BaseSettings):
@@ -21,6 +23,9 @@ class Settings(BaseSettings):
     API_V1_STR: str = "/api/v1"
     PROJECT_NAME: str = "eu-ai-act-compliance-bot"
     
+    # Worker threads for sync (def) endpoints; Starlette defaults to 40
+    THREADPOOL_SIZE: int = 200
+    
     # CORS
     CORS_ORIGINS: List[str] = [
         "http://localhost:3000",  # Next.js dev server
@@ -55,7 +60,7 @@ class Settings(BaseSettings):
     RATE_LIMIT_PERIOD: int = 3600  # 1 hour
     
     # Analysis Settings
-    MAX_ANALYSIS_LENGTH: int = 50000  # Max characters in AI system description
+    MAX_ANALYSIS_LENGTH: int = MAX_DESCRIPTION_LENGTH  # Max characters in AI system description
     DEFAULT_TEMPERATURE: float = 0.1  # Low temperature for consistent analysis
     MAX_TOKENS: int = 4000
     
@@ -71,8 +76,9 @@ class Settings(BaseSettings):
         env_file = ".env"
         case_sensitive = True
 
-    def get_database_url(self) -> str:
-        """Construct database URL from components."""
+    @cached_property
+    def database_url(self) -> str:
+        """Database URL constructed once from components."""
         if self.DATABASE_URL:
             return self.DATABASE_URL
         
@@ -85,7 +91,7 @@ class Settings(BaseSettings):
         # Fallback to SQLite for development
         return "sqlite:///./eu_ai_act_bot.db"
 
-    @property
+    @cached_property
     def cors_origins_list(self) -> List[str]:
         """Convert CORS origins to list if string."""
         if isinstance(self.CORS_ORIGINS, str):
@@ -0,0 +1,60 @@
+"""
+Logging setup for EU AI Act Compliance Bot.
+
+Log records are handed to a queue and written to stderr by a background
+listener thread, so request handlers never block on log I/O.
+"""
+
+import logging
+import logging.handlers
+import queue
+from typing import List, Optional, Tuple
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_listener: Optional[logging.handlers.QueueListener] = None
+
+# Root logger handlers and level replaced by setup_logging, restored on shutdown
+_saved_root_state: Optional[Tuple[List[logging.Handler], int]] = None
+
+
+def setup_logging(level: str = "INFO") -> None:
+    """
+    Route root logger output through a queue drained by a listener thread.
+
+    Idempotent; pair each setup with shutdown_logging().
+    """
+    global _listener, _saved_root_state
+
+    if _listener is not None:
+        return
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    root = logging.getLogger()
+    _saved_root_state = (root.handlers[:], root.level)
+    root.handlers = [logging.handlers.QueueHandler(_log_queue)]
+    root.setLevel(level)
+
+    _listener = logging.handlers.QueueListener(
+        _log_queue, stream_handler, respect_handler_level=True
+    )
+    _listener.start()
+
+
+def shutdown_logging() -> None:
+    """Flush queued records, stop the listener thread and restore root handlers."""
+    global _listener, _saved_root_state
+
+    if _listener is None:
+        return
+
+    _listener.stop()
+    _listener = None
+
+    root = logging.getLogger()
+    root.handlers, level = _saved_root_state
+    root.setLevel(level)
+    _saved_root_state = None
@@ -6,12 +6,16 @@ and related data structures.
 """
 
 from pydantic import BaseModel, Field, validator
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Literal
 from enum import Enum
 from datetime import datetime
 import uuid
 
 
+# Maximum characters accepted in an AI system description
+MAX_DESCRIPTION_LENGTH = 50000
+
+
 class RiskCategory(str, Enum):
     """EU AI Act risk categories."""
     UNACCEPTABLE = "unacceptable"
@@ -55,6 +59,10 @@ class DataType(str, Enum):
     PUBLIC_DATA = "public_data"
 
 
+# Data types that bring GDPR personal-data obligations
+_PERSONAL_DATA_TYPES = frozenset(dt for dt in DataType if "personal" in dt.value)
+
+
 class DeploymentContext(str, Enum):
     """Context where AI system is deployed."""
     PUBLIC_SPACE = "public_space"
@@ -68,6 +76,15 @@ class DeploymentContext(str, Enum):
     PRIVATE_USE = "private_use"
 
 
+class ProhibitedPractice(str, Enum):
+    """Article 5 prohibited AI practices."""
+    SUBLIMINAL_MANIPULATION = "subliminal_manipulation"
+    EXPLOITATION_OF_VULNERABILITIES = "exploitation_of_vulnerabilities"
+    SOCIAL_SCORING = "social_scoring"
+    REAL_TIME_BIOMETRIC_IDENTIFICATION = "real_time_biometric_identification"
+    EMOTION_RECOGNITION_WORKPLACE_EDUCATION = "emotion_recognition_workplace_education"
+
+
 class ComplianceStatus(str, Enum):
     """Compliance status for specific requirements."""
     COMPLIANT = "compliant"
@@ -77,16 +94,24 @@ class ComplianceStatus(str, Enum):
     NOT_APPLICABLE = "not_applicable"
 
 
+class Priority(str, Enum):
+    """Recommendation priority levels, most urgent first."""
+    CRITICAL = "critical"
+    HIGH = "high"
+    MEDIUM = "medium"
+    LOW = "low"
+
+
 class Recommendation(BaseModel):
     """Individual compliance recommendation."""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     title: str = Field(..., description="Brief recommendation title")
     description: str = Field(..., description="Detailed recommendation")
-    priority: str = Field(..., regex="^(critical|high|medium|low)$")
+    priority: Priority = Field(..., description="Recommendation priority")
     category: str = Field(..., description="Recommendation category (technical, process, legal)")
     estimated_effort: str = Field(..., description="Estimated implementation effort")
     timeline: str = Field(..., description="Suggested timeline for implementation")
-    references: List[str] = Field(default=[], description="EU AI Act article references")
+    references: List[str] = Field(default_factory=list, description="EU AI Act article references")
 
 
 class RequirementAssessment(BaseModel):
@@ -97,21 +122,24 @@ class RequirementAssessment(BaseModel):
     status: ComplianceStatus = Field(..., description="Compliance status")
     rationale: str = Field(..., description="Rationale for assessment")
     evidence: Optional[str] = Field(None, description="Supporting evidence")
-    recommendations: List[str] = Field(default=[], description="Specific recommendations for this requirement")
+    recommendations: List[str] = Field(default_factory=list, description="Specific recommendations for this requirement")
 
 
 class AISystemDescription(BaseModel):
     """Description of AI system for compliance assessment."""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     name: str = Field(..., min_length=1, max_length=200)
-    description: str = Field(..., min_length=10, max_length=50000)
+    description: str = Field(..., min_length=10, max_length=MAX_DESCRIPTION_LENGTH)
     domain: AIApplicationDomain = Field(..., description="Primary application domain")
-    additional_domains: List[AIApplicationDomain] = Field(default=[], description="Additional domains")
+    additional_domains: List[AIApplicationDomain] = Field(default_factory=list, description="Additional domains")
     
     # Technical details
     ai_techniques: List[str] = Field(..., description="AI/ML techniques used")
     data_types: List[DataType] = Field(..., description="Types of data processed")
     deployment_context: DeploymentContext = Field(..., description="Deployment context")
+    prohibited_practices: List[ProhibitedPractice] = Field(
+        default_factory=list, description="Article 5 practices the system performs"
+    )
     
     # Scope and impact
     target_users: str = Field(..., description="Target user groups")
@@ -119,7 +147,9 @@ class AISystemDescription(BaseModel):
     estimated_users: Optional[int] = Field(None, ge=0, description="Estimated number of users")
     
     # Development details
-    development_stage: str = Field(..., regex="^(concept|development|testing|production|discontinued)$")
+    development_stage: Literal["concept", "development", "testing", "production", "discontinued"] = Field(
+        ..., description="Current development stage"
+    )
     vendor_info: Optional[str] = Field(None, description="Vendor or development organization")
     
     # Additional context
@@ -131,11 +161,16 @@ class AISystemDescription(BaseModel):
         if not v:
             raise ValueError("At least one item must be specified")
         return v
+    
+    @property
+    def has_personal_data(self) -> bool:
+        """Whether any processed data type is personal data."""
+        return not _PERSONAL_DATA_TYPES.isdisjoint(self.data_types)
 
 
 class ComplianceReport(BaseModel):
     """Comprehensive compliance assessment report."""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     system_id: str = Field(..., description="AI system identifier")
     generated_at: datetime = Field(default_factory=datetime.utcnow)
     
@@ -154,11 +189,11 @@ class ComplianceReport(BaseModel):
     
     # Compliance timeline
     estimated_compliance_time: Optional[str] = Field(None, description="Estimated time to achieve compliance")
-    critical_deadlines: List[Dict[str, Any]] = Field(default=[], description="Critical compliance deadlines")
+    critical_deadlines: List[Dict[str, Any]] = Field(default_factory=list, description="Critical compliance deadlines")
     
     # Metadata
     analysis_version: str = Field(default="1.0", description="Analysis methodology version")
-    confidence_level: str = Field(..., regex="^(high|medium|low)$", description="Confidence in assessment")
+    confidence_level: Literal["high", "medium", "low"] = Field(..., description="Confidence in assessment")
     
     @validator('requirement_assessments')
     def validate_requirements_not_empty(cls, v):
@@ -170,7 +205,7 @@ class ComplianceReport(BaseModel):
 class ComplianceAnalysisRequest(BaseModel):
     """Request model for compliance analysis."""
     ai_system: AISystemDescription = Field(..., description="AI system to analyze")
-    analysis_options: Dict[str, Any] = Field(default={}, description="Analysis configuration options")
+    analysis_options: Dict[str, Any] = Field(default_factory=dict, description="Analysis configuration options")
     user_id: Optional[str] = Field(None, description="User identifier for tracking")
 
 
@@ -180,4 +215,18 @@ class ComplianceAnalysisResponse(BaseModel):
     report: Optional[ComplianceReport] = Field(None, description="Compliance report if successful")
     error_message: Optional[str] = Field(None, description="Error message if failed")
     analysis_id: str = Field(..., description="Unique analysis identifier")
-    processing_time_seconds: Optional[float] = Field(None, description="Time taken for analysis")
\ No newline at end of file
+    processing_time_seconds: Optional[float] = Field(None, description="Time taken for analysis")
+
+
+class RiskCategoryInfo(BaseModel):
+    """Reference description of an EU AI Act risk category."""
+    category: RiskCategory = Field(..., description="Risk category identifier")
+    title: str = Field(..., description="Human-readable category name")
+    description: str = Field(..., description="What the category means under the EU AI Act")
+    examples: List[str] = Field(..., description="Example systems in this category")
+
+
+class ApplicationDomainInfo(BaseModel):
+    """Reference description of an AI application domain."""
+    domain: AIApplicationDomain = Field(..., description="Application domain identifier")
+    description: str = Field(..., description="Domain description")
@@ -6,15 +6,18 @@ Command-line interface for testing compliance analysis functionality.
 """
 
 import asyncio
-import json
 import sys
-from typing import Optional
 import argparse
+import time
 from datetime import datetime
+from typing import Tuple
+
+import orjson
 
 from app.models.compliance import (
     AISystemDescription, 
     AIApplicationDomain,
+    ComplianceReport,
     DataType,
     DeploymentContext
 )
@@ -70,60 +73,68 @@ def create_sample_systems():
     }
 
 
-async def analyze_system(system_name: str, system: AISystemDescription, verbose: bool = False):
-    """Analyze a single AI system and display results."""
-    
-    print(f"\n{'='*60}")
-    print(f"ANALYZING: {system.name}")
-    print(f"{'='*60}")
-    
-    if verbose:
-        print(f"\nSYSTEM DETAILS:")
-        print(f"Domain: {system.domain}")
-        print(f"Description: {system.description[:200]}...")
-        print(f"AI Techniques: {', '.join(system.ai_techniques)}")
-        print(f"Data Types: {', '.join([dt.value for dt in system.data_types])}")
-        print(f"Deployment: {system.deployment_context}")
-    
-    # Initialize analyzer
-    analyzer = ComplianceAnalyzerService()
+async def run_analysis(
+    analyzer: ComplianceAnalyzerService,
+    system: AISystemDescription
+) -> Tuple[ComplianceReport, float]:
+    """Analyze a single AI system, returning the report and elapsed seconds."""
     
     # Perform analysis
-    start_time = datetime.now()
+    start_time = time.perf_counter()
     report = await analyzer.analyze_system(system)
-    analysis_time = (datetime.now() - start_time).total_seconds()
+    analysis_time = time.perf_counter() - start_time
+    
+    return report, analysis_time
+
+
+def format_report(system: AISystemDescription, report: ComplianceReport, analysis_time: float, verbose: bool = False) -> str:
+    """Render analysis results for a single AI system as console text."""
+    
+    lines = []
+    
+    lines.append(f"\n{'='*60}")
+    lines.append(f"ANALYZING: {system.name}")
+    lines.append(f"{'='*60}")
+    
+    if verbose:
+        lines.append(f"\nSYSTEM DETAILS:")
+        lines.append(f"Domain: {system.domain}")
+        lines.append(f"Description: {system.description[:200]}...")
+        lines.append(f"AI Techniques: {', '.join(system.ai_techniques)}")
+        lines.append(f"Data Types: {', '.join([dt.value for dt in system.data_types])}")
+        lines.append(f"Deployment: {system.deployment_context}")
     
     # Display results
-    print(f"\nCOMPLIANCE ASSESSMENT RESULTS:")
-    print(f"Risk Category: {report.risk_category.value.upper()}")
-    print(f"Compliance Score: {report.compliance_score:.2f}")
-    print(f"Analysis Time: {analysis_time:.2f} seconds")
+    lines.append(f"\nCOMPLIANCE ASSESSMENT RESULTS:")
+    lines.append(f"Risk Category: {report.risk_category.value.upper()}")
+    lines.append(f"Compliance Score: {report.compliance_score:.2f}")
+    lines.append(f"Analysis Time: {analysis_time:.3f} seconds")
     
-    print(f"\nEXECUTIVE SUMMARY:")
-    print(report.executive_summary)
+    lines.append(f"\nEXECUTIVE SUMMARY:")
+    lines.append(report.executive_summary)
     
-    print(f"\nKEY RISKS ({len(report.key_risks)}):")
+    lines.append(f"\nKEY RISKS ({len(report.key_risks)}):")
     for i, risk in enumerate(report.key_risks, 1):
-        print(f"{i}. {risk}")
+        lines.append(f"{i}. {risk}")
     
-    print(f"\nIMMEDIATE ACTIONS ({len(report.immediate_actions)}):")
+    lines.append(f"\nIMMEDIATE ACTIONS ({len(report.immediate_actions)}):")
     for i, action in enumerate(report.immediate_actions, 1):
-        print(f"{i}. {action}")
+        lines.append(f"{i}. {action}")
     
     if verbose:
-        print(f"\nDETAILED REQUIREMENTS ({len(report.requirement_assessments)}):")
+        lines.append(f"\nDETAILED REQUIREMENTS ({len(report.requirement_assessments)}):")
         for req in report.requirement_assessments:
-            print(f"- {req.title}: {req.status.value}")
-            print(f"  Rationale: {req.rationale}")
+            lines.append(f"- {req.title}: {req.status.value}")
+            lines.append(f"  Rationale: {req.rationale}")
         
-        print(f"\nRECOMMENDATIONS ({len(report.recommendations)}):")
+        lines.append(f"\nRECOMMENDATIONS ({len(report.recommendations)}):")
         for rec in report.recommendations:
-            print(f"- [{rec.priority.upper()}] {rec.title}")
-            print(f"  {rec.description}")
-            print(f"  Timeline: {rec.timeline}")
-            print(f"  Effort: {rec.estimated_effort}")
+            lines.append(f"- [{rec.priority.upper()}] {rec.title}")
+            lines.append(f"  {rec.description}")
+            lines.append(f"  Timeline: {rec.timeline}")
+            lines.append(f"  Effort: {rec.estimated_effort}")
     
-    return report
+    return "\n".join(lines) + "\n"
 
 
 async def main():
@@ -164,18 +175,23 @@ async def main():
     results = {}
     
     if args.system == "all":
-        # Analyze all systems
-        for system_name, system_desc in systems.items():
-            report = await analyze_system(system_name, system_desc, args.verbose)
-            results[system_name] = report
+        selected = systems
+    elif args.system in systems:
+        selected = {args.system: systems[args.system]}
     else:
-        # Analyze specific system
-        if args.system in systems:
-            report = await analyze_system(args.system, systems[args.system], args.verbose)
-            results[args.system] = {args.system: report}
-        else:
-            print(f"Error: Unknown system '{args.system}'")
-            return 1
+        print(f"Error: Unknown system '{args.system}'")
+        return 1
+    
+    # One analyzer serves every system in this run
+    analyzer = ComplianceAnalyzerService()
+    
+    # Analyze selected systems concurrently, then display in order; the
+    # human-readable report is skipped when JSON output is requested
+    analyses = await asyncio.gather(*(run_analysis(analyzer, system_desc) for system_desc in selected.values()))
+    for (system_name, system_desc), (report, analysis_time) in zip(selected.items(), analyses):
+        if not args.json:
+            sys.stdout.write(format_report(system_desc, report, analysis_time, args.verbose))
+        results[system_name] = report
     
     # Handle JSON output
     if args.json:
@@ -183,23 +199,24 @@ async def main():
         for name, report in results.items():
             json_results[name] = {
                 "system_id": report.system_id,
-                "risk_category": report.risk_category.value,
+                "risk_category": report.risk_category,
                 "compliance_score": report.compliance_score,
-                "generated_at": report.generated_at.isoformat(),
+                "generated_at": report.generated_at,
                 "key_risks": report.key_risks,
                 "immediate_actions": report.immediate_actions,
                 "estimated_compliance_time": report.estimated_compliance_time
             }
         
-        json_output = json.dumps(json_results, indent=2)
+        json_output = orjson.dumps(json_results, option=orjson.OPT_INDENT_2)
         
         if args.save:
-            with open(args.save, 'w') as f:
+            with open(args.save, 'wb') as f:
                 f.write(json_output)
             print(f"\nResults saved to: {args.save}")
         else:
             print("\nJSON OUTPUT:")
-            print(json_output)
+            sys.stdout.flush()
+            sys.stdout.buffer.write(json_output + b"\n")
     
     print(f"\n{'='*60}")
     print("ANALYSIS COMPLETE")
@@ -6,29 +6,31 @@ Main application entry point for the compliance assessment API.
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
+import anyio
 import logging
-import os
 from dotenv import load_dotenv
 
 from app.api import analysis, health
 from app.core.config import settings
+from app.core.logging import setup_logging, shutdown_logging
 
 # Load environment variables
 load_dotenv()
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
 logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events."""
+    # Queue-backed logging lives for the lifespan; shutdown stops it again
+    setup_logging(settings.LOG_LEVEL)
     logger.info("Starting EU AI Act Compliance Bot API")
     
+    # Sync endpoints run in AnyIO's worker pool; size it for concurrent load
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_SIZE
+    
     # Initialize services here
     # await initialize_knowledge_base()
     # await initialize_vector_db()
@@ -38,6 +40,7 @@ async def lifespan(app: FastAPI):
     logger.info("Shutting down EU AI Act Compliance Bot API")
     # Cleanup here
     # await cleanup_resources()
+    shutdown_logging()
 
 # Create FastAPI application
 app = FastAPI(
@@ -46,6 +49,7 @@ app = FastAPI(
     version="0.1.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
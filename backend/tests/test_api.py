@@ -0,0 +1,172 @@
+"""
+Test cases for the EU AI Act Compliance Bot API endpoints.
+"""
+
+import pytest
+from datetime import datetime, timezone
+import logging
+import logging.handlers
+from fastapi.testclient import TestClient
+
+from app.api import analysis, health
+from app.core import logging as app_logging
+from app.models.compliance import ComplianceAnalysisResponse
+from main import app
+
+
+HIRING_SYSTEM_PAYLOAD = {
+    "name": "Resume Screener",
+    "description": "AI system that automatically screens resumes and ranks candidates for job openings.",
+    "domain": "employment",
+    "ai_techniques": ["Machine Learning"],
+    "data_types": ["personal_data"],
+    "deployment_context": "workplace",
+    "target_users": "HR departments",
+    "geographic_scope": ["EU"],
+    "development_stage": "production"
+}
+
+
+@pytest.fixture
+def client():
+    """Test client running the application lifespan."""
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture
+def fresh_dependency_checks():
+    """Start and finish each test with empty dependency check caches."""
+    health._check_database.cache_clear()
+    health._check_ai_services.cache_clear()
+    yield
+    health._check_database.cache_clear()
+    health._check_ai_services.cache_clear()
+
+
+class TestAssessEndpoint:
+    """Test the compliance assessment endpoint."""
+    
+    def test_assess_returns_analysis_response(self, client):
+        """Test that /assess returns a complete JSON analysis response."""
+        response = client.post("/api/v1/analysis/assess", json={"ai_system": HIRING_SYSTEM_PAYLOAD})
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        
+        body = response.json()
+        parsed = ComplianceAnalysisResponse.model_validate(body)
+        assert parsed.success is True
+        assert parsed.report is not None
+        assert parsed.report.risk_category == "high"
+        assert len(parsed.report.requirement_assessments) > 0
+        assert len(parsed.report.recommendations) > 0
+        
+        # The body is exactly the serialized response model
+        assert body == parsed.model_dump(mode="json")
+    
+    def test_analyzer_failure_cached_for_ttl(self, client, monkeypatch):
+        """Test that a failed analyzer build answers 503 and is not retried until the TTL expires."""
+        attempts = []
+        
+        def failing_build():
+            attempts.append(1)
+            raise RuntimeError("missing credentials")
+        
+        monkeypatch.setattr(analysis, "_build_compliance_analyzer", failing_build)
+        monkeypatch.setattr(analysis, "_analyzer_failure", None)
+        
+        for _ in range(2):
+            response = client.post("/api/v1/analysis/assess", json={"ai_system": HIRING_SYSTEM_PAYLOAD})
+            assert response.status_code == 503
+            assert "missing credentials" in response.json()["detail"]
+        assert len(attempts) == 1
+        
+        # Once the cached failure expires, the next request retries the build
+        expiry, detail = analysis._analyzer_failure
+        expired = (expiry - analysis.ANALYZER_FAILURE_TTL_SECONDS, detail)
+        monkeypatch.setattr(analysis, "_analyzer_failure", expired)
+        response = client.post("/api/v1/analysis/assess", json={"ai_system": HIRING_SYSTEM_PAYLOAD})
+        assert response.status_code == 503
+        assert len(attempts) == 2
+
+
+class TestHealthEndpoints:
+    """Test the health and readiness endpoints."""
+    
+    def test_dependency_checks_cached_within_ttl(self, client, fresh_dependency_checks, monkeypatch):
+        """Test that dependency checks are reused until their TTL expires."""
+        monkeypatch.setattr(health, "_ANTHROPIC_API_KEY", None)
+        first = client.get("/health/detailed").json()
+        assert first["ai_services"]["details"]["services"]["anthropic"] == "not_configured"
+        
+        # A configuration change is not seen while the cached check is fresh
+        monkeypatch.setattr(health, "_ANTHROPIC_API_KEY", "test-key")
+        cached = client.get("/health/detailed").json()
+        assert cached["ai_services"] == first["ai_services"]
+        
+        health._check_ai_services.cache_clear()
+        refreshed = client.get("/health/detailed").json()
+        assert refreshed["ai_services"]["details"]["services"]["anthropic"] == "configured"
+    
+    def test_dependency_checks_return_copies(self, client, fresh_dependency_checks):
+        """Test that mutating a cached check result does not leak into later responses."""
+        first = client.get("/health/detailed").json()
+        
+        # Endpoints mutating a check result must not change the cached value
+        result = client.portal.call(health._check_database)
+        result["details"]["database_url"] = "tampered"
+        result["status"] = "tampered"
+        
+        second = client.get("/health/detailed").json()
+        assert second["database"] == first["database"]
+    
+    def test_memory_sample_not_shared(self, client):
+        """Test that each health response gets its own memory usage details."""
+        health._read_memory.cache_clear()
+        first = health._sample_memory()
+        first["memory_mb"] = -1.0
+        
+        second = health._sample_memory()
+        assert second["memory_mb"] > 0
+        assert second is not first
+        
+        response = client.get("/health/")
+        assert response.status_code == 200
+        assert response.json()["checks"]["memory_usage"]["details"]["memory_mb"] > 0
+    
+    def test_health_timestamps_are_current(self, client):
+        """Test that every health response carries its own UTC timestamp."""
+        before = datetime.now(timezone.utc)
+        first = client.get("/health/").json()
+        second = client.get("/health/live").json()
+        after = datetime.now(timezone.utc)
+        
+        for body in (first, second):
+            timestamp = datetime.fromisoformat(body["timestamp"])
+            assert timestamp.tzinfo is not None
+            assert before <= timestamp <= after
+        
+        schema = client.get("/openapi.json").json()["components"]["schemas"]["HealthResponse"]
+        assert schema["properties"]["timestamp"]["format"] == "date-time"
+
+
+class TestApplicationLifespan:
+    """Test application startup and shutdown."""
+    
+    def test_logging_setup_and_teardown(self):
+        """Test that each lifespan starts queue logging and restores the root logger on shutdown."""
+        root = logging.getLogger()
+        handlers, level = root.handlers[:], root.level
+        
+        # Twice, so a restarted app sets logging up again after a clean shutdown
+        for _ in range(2):
+            with TestClient(app) as client:
+                assert app_logging._listener is not None
+                assert [type(handler) for handler in root.handlers] == [logging.handlers.QueueHandler]
+                client.get("/health/live")
+            
+            assert app_logging._listener is None
+            assert app_logging._log_queue.empty()
+            assert root.handlers == handlers
+            assert root.level == level